@@ -1,13 +1,17 @@
 
 import asyncio
-import json
+import os
 import random
+import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Deque, List, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 
@@ -100,15 +104,26 @@ class HistoricalRecord(BaseModel):
 # MÓDULO: DATA SIMULATOR (Simulação de Dados do Hardware)
 # ============================================================================
 
+# Referências locais às funções de sorteio (evita a busca do atributo em
+# `random` a cada chamada no loop de atualização). Os valores contínuos são
+# sorteados como `mínimo + amplitude * _random()`, equivalente a
+# random.uniform(mínimo, máximo) sem o custo da função Python intermediária.
+_random = random.random
+_randint = random.randint
+
 
 class DataSimulator:
     """
-    Responsável por simular dados brutos vindos do hardware robótico.
+    Responsável por simular dados vindos do hardware robótico.
     Gera valores aleatórios realistas para testes e desenvolvimento.
+
+    Os dados são emitidos diretamente no formato processado, sem passar
+    pelos modelos Raw*. Como os valores já são gerados com os tipos
+    corretos, os modelos são criados com model_construct (sem validação).
     """
 
     @staticmethod
-    def generate_motor_data(motor_id: int) -> RawMotorData:
+    def generate_motor_data(motor_id: int) -> ProcessedMotor:
         """
         Gera dados simulados para um motor específico
 
@@ -116,55 +131,63 @@ class DataSimulator:
             motor_id: ID do motor (1, 2 ou 3)
 
         Returns:
-            RawMotorData com valores aleatórios realistas
+            ProcessedMotor com valores aleatórios realistas
         """
-        return RawMotorData(
+        return ProcessedMotor.model_construct(
             id=motor_id,
-            velocity=round(random.uniform(130.0, 160.0), 1),
-            cm=round(random.uniform(10.0, 30.0), 1),
-            temperature=round(random.uniform(65.0, 80.0), 1),
+            velocity=round(130.0 + 30.0 * _random(), 1),  # 130.0 - 160.0
+            distance=round(10.0 + 20.0 * _random(), 1),  # 10.0 - 30.0
+            temperature=round(65.0 + 15.0 * _random(), 1),  # 65.0 - 80.0
         )
 
     @staticmethod
-    def generate_pallet_data() -> RawPalletData:
+    def generate_pallet_data() -> ProcessedPallet:
         """
         Gera dados simulados para um pallet
 
         Returns:
-            RawPalletData com timestamp atual
+            ProcessedPallet com timestamp atual
         """
-        return RawPalletData(
-            id_pallet=random.randint(1, 100),
-            timestamp_raw=datetime.now(timezone.utc).isoformat(),
+        return ProcessedPallet.model_construct(
+            id=_randint(1, 100),
+            timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
     @staticmethod
-    def generate_centroid_data() -> RawCentroidData:
+    def generate_centroid_data() -> Giroscopio:
         """
         Gera dados simulados para o giroscópio (centróide)
 
         Returns:
-            RawCentroidData com coordenadas normalizadas
+            Giroscopio com coordenadas normalizadas
         """
-        return RawCentroidData(
-            centroid_x=round(random.uniform(-1.0, 1.0), 2),
-            centroid_y=round(random.uniform(-1.0, 1.0), 2),
-            centroid_z=round(random.uniform(-1.0, 1.0), 2),
+        centroid = Centroid.model_construct(
+            x=round(-1.0 + 2.0 * _random(), 2),  # -1.0 - 1.0
+            y=round(-1.0 + 2.0 * _random(), 2),
+            z=round(-1.0 + 2.0 * _random(), 2),
         )
+        return Giroscopio.model_construct(centroid=centroid)
 
     @classmethod
-    def simulate_hardware_data(cls) -> RawHardwareData:
+    def simulate_hardware_data(cls) -> ProcessedRobotData:
         """
         Simula uma coleta completa de dados do hardware
 
         Returns:
-            RawHardwareData contendo dados de todos os sensores
+            ProcessedRobotData contendo dados de todos os sensores
         """
-        motors = [cls.generate_motor_data(i) for i in range(1, 4)]
+        # Número fixo de motores: lista desenrolada, sem criar range a cada ciclo
+        motors = [
+            cls.generate_motor_data(1),
+            cls.generate_motor_data(2),
+            cls.generate_motor_data(3),
+        ]
         pallet = cls.generate_pallet_data()
-        centroid = cls.generate_centroid_data()
+        giroscopio = cls.generate_centroid_data()
 
-        return RawHardwareData(motors=motors, pallet=pallet, centroid=centroid)
+        return ProcessedRobotData.model_construct(
+            motors=motors, pallets=[pallet], giroscopio=giroscopio
+        )
 
 
 # ============================================================================
@@ -176,64 +199,20 @@ class DataProcessor:
     """
     Responsável por transformar dados brutos em formato processado.
     Realiza renomeação de variáveis e reestruturação para formato ML.
-    """
-
-    @staticmethod
-    def process_motor(raw_motor: RawMotorData) -> ProcessedMotor:
-        """
-        Processa dados de um motor individual
 
-        Args:
-            raw_motor: Dados brutos do motor
-
-        Returns:
-            ProcessedMotor com variáveis renomeadas (cm -> distance)
-        """
-        return ProcessedMotor(
-            id=raw_motor.id,
-            velocity=raw_motor.velocity,
-            distance=raw_motor.cm,  # Renomeação: cm -> distance
-            temperature=raw_motor.temperature,
-        )
+    Usado para dados vindos de hardware real (modelos Raw*); o simulador
+    já emite dados no formato processado.
+    """
 
     @staticmethod
-    def process_pallet(raw_pallet: RawPalletData) -> ProcessedPallet:
-        """
-        Processa dados de um pallet
-
-        Args:
-            raw_pallet: Dados brutos do pallet
-
-        Returns:
-            ProcessedPallet com variáveis renomeadas (id_pallet -> id, timestamp_raw -> timestamp)
+    def process_hardware_data(raw_data: RawHardwareData) -> ProcessedRobotData:
         """
-        return ProcessedPallet(
-            id=raw_pallet.id_pallet,  # Renomeação: id_pallet -> id
-            timestamp=raw_pallet.timestamp_raw,  # Renomeação: timestamp_raw -> timestamp
-        )
+        Processa todos os dados brutos do hardware em uma única passagem
 
-    @staticmethod
-    def process_centroid(raw_centroid: RawCentroidData) -> Giroscopio:
-        """
-        Processa dados do giroscópio
-
-        Args:
-            raw_centroid: Dados brutos do centróide
-
-        Returns:
-            Giroscopio com estrutura aninhada {"centroid": {"x", "y", "z"}}
-        """
-        centroid = Centroid(
-            x=raw_centroid.centroid_x,
-            y=raw_centroid.centroid_y,
-            z=raw_centroid.centroid_z,
-        )
-        return Giroscopio(centroid=centroid)
-
-    @classmethod
-    def process_hardware_data(cls, raw_data: RawHardwareData) -> ProcessedRobotData:
-        """
-        Processa todos os dados brutos do hardware
+        Renomeações:
+            motor: cm -> distance
+            pallet: id_pallet -> id, timestamp_raw -> timestamp
+            centróide: centroid_x/y/z -> giroscopio.centroid.x/y/z
 
         Args:
             raw_data: Dados brutos completos do hardware
@@ -241,14 +220,31 @@ class DataProcessor:
         Returns:
             ProcessedRobotData no formato final para ML
         """
-        processed_motors = [cls.process_motor(motor) for motor in raw_data.motors]
-        processed_pallet = cls.process_pallet(raw_data.pallet)
-        processed_giroscopio = cls.process_centroid(raw_data.centroid)
+        raw_centroid = raw_data.centroid
 
         return ProcessedRobotData(
-            motors=processed_motors,
-            pallets=[processed_pallet],  # Lista com um elemento
-            giroscopio=processed_giroscopio,
+            motors=[
+                ProcessedMotor(
+                    id=motor.id,
+                    velocity=motor.velocity,
+                    distance=motor.cm,
+                    temperature=motor.temperature,
+                )
+                for motor in raw_data.motors
+            ],
+            pallets=[
+                ProcessedPallet(
+                    id=raw_data.pallet.id_pallet,
+                    timestamp=raw_data.pallet.timestamp_raw,
+                )
+            ],
+            giroscopio=Giroscopio(
+                centroid=Centroid(
+                    x=raw_centroid.centroid_x,
+                    y=raw_centroid.centroid_y,
+                    z=raw_centroid.centroid_z,
+                )
+            ),
         )
 
 
@@ -278,14 +274,39 @@ class DataManager:
             return
 
         self.current_data: Optional[ProcessedRobotData] = None
-        self.historical_data: List[HistoricalRecord] = []
+        # JSON dos dados atuais, serializado uma única vez por atualização
+        self.current_json_bytes: Optional[bytes] = None
+        # Histórico em memória limitado aos últimos registros (o arquivo
+        # NDJSON mantém o histórico completo). Cada HistoricalRecord é
+        # imutável após a coleta, então é guardado já serializado em JSON.
+        self.historical_data: Deque[bytes] = deque(maxlen=10_000)
 
         # Caminhos dos arquivos
         self.data_path = Path("data/robot_data.json")
-        self.hist_data_path = Path("data/hist_data.json")
+        self.hist_data_path = Path("data/hist_data.ndjson")
+        # Formato antigo do histórico (array JSON), migrado na inicialização
+        self.legacy_hist_data_path = Path("data/hist_data.json")
+
+        # Handle do histórico (append-only), aberto sob demanda
+        self._hist_file = None
+
+        # Persistência em lote: grava em disco a cada N ciclos de atualização
+        self._pending_hist: List[bytes] = []
+        self._dirty_count = 0
+        self._flush_every = 20
+
+        # Intervalo máximo entre atualizações (segundos) e instante da última
+        self.update_interval = 2.0
+        self._last_update: Optional[float] = None
+
+        # Locks (estado em memória e escrita em disco) e evento de wakeup.
+        # Criados sob demanda no event loop em execução (ver _bind_loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._io_lock: Optional[asyncio.Lock] = None
+        self._wakeup: Optional[asyncio.Event] = None
 
         self.simulator = DataSimulator()
-        self.processor = DataProcessor()
         self._initialized = True
 
         # Cria diretório se não existir
@@ -293,61 +314,209 @@ class DataManager:
 
         # Carrega dados existentes, se houver
         self._load_current_from_disk()
+        self._migrate_legacy_historical()
         self._load_historical_from_disk()
 
     def _load_current_from_disk(self):
         """Carrega dados atuais persistidos do disco (se existirem)"""
         if self.data_path.exists():
             try:
-                with open(self.data_path, "r", encoding="utf-8") as f:
-                    data_dict = json.load(f)
-                    self.current_data = ProcessedRobotData(**data_dict)
+                with open(self.data_path, "rb") as f:
+                    self.current_data = ProcessedRobotData.model_validate_json(f.read())
+                    self.current_json_bytes = orjson.dumps(
+                        self.current_data.model_dump()
+                    )
                     print(f"[INFO] Dados atuais carregados de {self.data_path}")
             except Exception as e:
                 print(f"[AVISO] Erro ao carregar dados atuais do disco: {e}")
 
+    def _migrate_legacy_historical(self):
+        """
+        Converte o histórico no formato antigo (array JSON em hist_data.json)
+        para NDJSON, caso o arquivo novo ainda não exista
+        """
+        if self.hist_data_path.exists() or not self.legacy_hist_data_path.exists():
+            return
+
+        try:
+            with open(self.legacy_hist_data_path, "rb") as f:
+                hist_list = orjson.loads(f.read())
+            payload = b"".join(orjson.dumps(record) + b"\n" for record in hist_list)
+            self._write_file(self.hist_data_path, payload)
+            print(
+                f"[INFO] Histórico migrado de {self.legacy_hist_data_path} para "
+                f"{self.hist_data_path}: {len(hist_list)} registros"
+            )
+        except Exception as e:
+            print(f"[AVISO] Erro ao migrar histórico do formato antigo: {e}")
+
     def _load_historical_from_disk(self):
-        """Carrega histórico de dados do disco (se existir)"""
+        """Carrega histórico de dados do disco (se existir), uma linha por registro"""
         if self.hist_data_path.exists():
             try:
-                with open(self.hist_data_path, "r", encoding="utf-8") as f:
-                    hist_list = json.load(f)
-                    self.historical_data = [
-                        HistoricalRecord(**record) for record in hist_list
-                    ]
+                with open(self.hist_data_path, "rb") as f:
+                    # Mantém apenas as últimas linhas; só elas são validadas
+                    lines = deque(
+                        (line for line in map(bytes.strip, f) if line),
+                        maxlen=self.historical_data.maxlen,
+                    )
+
+                records = deque(maxlen=self.historical_data.maxlen)
+                skipped = 0
+                for line in lines:
+                    # Valida o registro, mas mantém os bytes originais.
+                    # Linhas inválidas (ex.: escrita interrompida) são ignoradas.
+                    try:
+                        HistoricalRecord.model_validate_json(line)
+                    except ValueError:
+                        skipped += 1
+                        continue
+                    records.append(line)
+                self.historical_data = records
+                print(
+                    f"[INFO] Histórico carregado: {len(self.historical_data)} registros"
+                )
+                if skipped:
                     print(
-                        f"[INFO] Histórico carregado: {len(self.historical_data)} registros"
+                        f"[AVISO] {skipped} linhas inválidas ignoradas em {self.hist_data_path}"
                     )
             except Exception as e:
                 print(f"[AVISO] Erro ao carregar histórico do disco: {e}")
 
-    def _save_current_to_disk(self):
-        """Persiste dados atuais no disco (substitui o arquivo)"""
-        if self.current_data is None:
-            return
+    @staticmethod
+    def _write_file(path: Path, payload: bytes):
+        """
+        Grava bytes em um arquivo substituindo seu conteúdo (bloqueante)
+
+        A escrita é feita em um arquivo temporário ao lado do destino, que
+        então substitui o original de forma atômica (os.replace). Leitores
+        nunca observam o arquivo truncado ou parcialmente escrito.
+        """
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _open_historical_file(self):
+        """
+        Abre o histórico para append (bloqueante)
+
+        Se o arquivo termina em uma linha incompleta (escrita interrompida),
+        acrescenta uma quebra de linha para que o próximo registro não seja
+        gravado colado a ela.
+        """
+        self._hist_file = open(self.hist_data_path, "ab")
+        if self._hist_file.tell() > 0:
+            with open(self.hist_data_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._hist_file.write(b"\n")
+
+    def _append_historical_file(self, payload: bytes):
+        """Acrescenta bytes ao final do histórico pelo handle em cache (bloqueante)"""
+        if self._hist_file is None:
+            self._open_historical_file()
+        self._hist_file.write(payload)
+        self._hist_file.flush()
+
+    def close(self):
+        """Fecha o arquivo de histórico (chamar após o flush final)"""
+        if self._hist_file is not None:
+            self._hist_file.close()
+            self._hist_file = None
+
+    async def _save_current_to_disk(self) -> bool:
+        """
+        Persiste dados atuais no disco (substitui o arquivo) fora do event loop
+
+        Returns:
+            True se os dados foram gravados (ou não há dados), False em caso de erro
+        """
+        if self.current_json_bytes is None:
+            return True
 
         try:
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    self.current_data.model_dump(), f, indent=2, ensure_ascii=False
-                )
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_file, self.data_path, self.current_json_bytes
+            )
             print(f"[INFO] Dados atuais salvos em {self.data_path}")
+            return True
         except Exception as e:
             print(f"[ERRO] Erro ao salvar dados atuais no disco: {e}")
+            return False
+
+    async def _save_historical_to_disk(self) -> bool:
+        """
+        Acrescenta os registros pendentes ao final do histórico
+        (NDJSON, append-only) fora do event loop
 
-    def _save_historical_to_disk(self):
-        """Persiste histórico completo no disco"""
+        Em caso de erro, os registros voltam para a fila de pendentes e são
+        gravados na próxima tentativa.
+
+        Returns:
+            True se os registros foram gravados (ou não há pendentes),
+            False em caso de erro
+        """
+        if not self._pending_hist:
+            return True
+
+        batch = self._pending_hist
+        self._pending_hist = []
         try:
-            with open(self.hist_data_path, "w", encoding="utf-8") as f:
-                hist_dict_list = [
-                    record.model_dump() for record in self.historical_data
-                ]
-                json.dump(hist_dict_list, f, indent=2, ensure_ascii=False)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._append_historical_file, b"".join(batch)
+            )
             print(
-                f"[INFO] Histórico salvo: {len(self.historical_data)} registros em {self.hist_data_path}"
+                f"[INFO] Histórico salvo: {len(batch)} novos registros em {self.hist_data_path}"
             )
+            return True
         except Exception as e:
+            # Recoloca o lote antes dos registros que chegaram durante a escrita
+            self._pending_hist = batch + self._pending_hist
             print(f"[ERRO] Erro ao salvar histórico no disco: {e}")
+            return False
+
+    async def flush(self):
+        """
+        Persiste no disco os dados atuais e os registros históricos pendentes
+
+        A gravação é protegida contra cancelamento (asyncio.shield): se o loop
+        de atualização for cancelado no meio de um flush, a escrita termina
+        e o flush do shutdown aguarda sua conclusão pelo lock de I/O.
+        """
+        await asyncio.shield(self._flush())
+
+    async def _flush(self):
+        """Executa o flush; o contador só é zerado após gravação bem-sucedida"""
+        self._bind_loop()
+        async with self._io_lock:
+            if self._dirty_count == 0 and not self._pending_hist:
+                return
+
+            dirty_count = self._dirty_count
+            current_saved = await self._save_current_to_disk()
+            historical_saved = await self._save_historical_to_disk()
+
+            if current_saved and historical_saved:
+                # Atualizações feitas durante a escrita continuam pendentes
+                self._dirty_count = max(self._dirty_count - dirty_count, 0)
+
+    def _bind_loop(self):
+        """
+        Cria os locks e o evento de wakeup no event loop em execução
+
+        Primitivas asyncio ficam presas ao loop em que são usadas. Como o
+        DataManager é um singleton criado na importação do módulo, elas são
+        recriadas quando o loop muda (ex.: novo lifespan no mesmo processo).
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._io_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
 
     def _add_to_historical(self, data: ProcessedRobotData):
         """
@@ -358,46 +527,118 @@ class DataManager:
         """
         timestamp_coleta = datetime.now(timezone.utc).isoformat()
         record = HistoricalRecord(timestamp_coleta=timestamp_coleta, data=data)
-        self.historical_data.append(record)
+        record_bytes = orjson.dumps(record.model_dump())
+        self.historical_data.append(record_bytes)
+        self._pending_hist.append(record_bytes + b"\n")
 
-    def update_data(self):
+    async def update_data(self):
         """
         Executa um ciclo completo de atualização:
-        1. Simula coleta de dados do hardware
-        2. Processa dados brutos
-        3. Atualiza estado interno (substitui dados atuais)
-        4. Adiciona ao histórico
-        5. Persiste ambos os arquivos no disco
+        1. Simula coleta de dados do hardware (já no formato processado)
+        2. Atualiza estado interno (substitui dados atuais)
+        3. Adiciona ao histórico
+        4. A cada N ciclos, persiste dados atuais e histórico no disco
+
+        A escrita em disco é executada em thread separada para não
+        bloquear o event loop (e as requisições da API) durante o I/O.
         """
         # Simula coleta de dados
-        raw_data = self.simulator.simulate_hardware_data()
-
-        # Processa dados
-        processed_data = self.processor.process_hardware_data(raw_data)
+        processed_data = self.simulator.simulate_hardware_data()
+        current_json_bytes = orjson.dumps(processed_data.model_dump())
 
-        # Atualiza estado atual (substitui)
-        self.current_data = processed_data
+        self._bind_loop()
+        async with self._lock:
+            # Atualiza estado atual (substitui)
+            self.current_data = processed_data
+            self.current_json_bytes = current_json_bytes
+            self._last_update = time.monotonic()
 
-        # Adiciona ao histórico
-        self._add_to_historical(processed_data)
+            # Adiciona ao histórico
+            self._add_to_historical(processed_data)
 
-        # Persiste dados atuais
-        self._save_current_to_disk()
+            self._dirty_count += 1
+            should_flush = self._dirty_count >= self._flush_every
 
-        # Persiste histórico
-        self._save_historical_to_disk()
+        # Persiste em lote a cada N ciclos (fora do lock de estado)
+        if should_flush:
+            await self.flush()
 
         print(
             f"[INFO] Dados atualizados em {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
 
-    def get_current_data(self) -> Optional[ProcessedRobotData]:
+    def wakeup(self):
+        """
+        Solicita uma atualização imediata ao loop em background
+        (ex.: chegada de um evento do sensor), sem esperar o intervalo máximo
+        """
+        # Sem evento ainda, o loop não começou a esperar: nada a acordar
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def is_stale(self) -> bool:
+        """Indica se a última atualização é mais antiga que o intervalo máximo"""
+        return (
+            self._last_update is None
+            or time.monotonic() - self._last_update > self.update_interval
+        )
+
+    async def wait_for_wakeup(self, timeout: float) -> bool:
+        """
+        Aguarda uma solicitação de atualização ou o fim do intervalo máximo
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            True se acordado por wakeup(), False se o intervalo expirou
+        """
+        self._bind_loop()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._wakeup.clear()
+        return True
+
+    async def get_current_data(self) -> Optional[ProcessedRobotData]:
         """Retorna os dados atuais"""
-        return self.current_data
+        self._bind_loop()
+        async with self._lock:
+            return self.current_data
+
+    async def get_current_json_bytes(self) -> Optional[bytes]:
+        """Retorna os dados atuais já serializados em JSON"""
+        self._bind_loop()
+        async with self._lock:
+            return self.current_json_bytes
+
+    async def get_historical_data(self) -> List[bytes]:
+        """Retorna uma cópia do histórico em memória (registros já em JSON)"""
+        self._bind_loop()
+        async with self._lock:
+            return list(self.historical_data)
+
+    async def iter_historical_json(self, chunk_size: int = 500) -> AsyncIterator[bytes]:
+        """
+        Monta o histórico como um array JSON a partir dos registros já
+        serializados, em blocos de até `chunk_size` registros
+
+        Args:
+            chunk_size: Quantidade de registros por fragmento transmitido
 
-    def get_historical_data(self) -> List[HistoricalRecord]:
-        """Retorna o histórico completo de dados"""
-        return self.historical_data
+        Yields:
+            Fragmentos em bytes do array JSON com todos os registros
+        """
+        # Cópia rasa: o loop de atualização pode acrescentar registros
+        # enquanto a resposta é transmitida
+        records = await self.get_historical_data()
+
+        yield b"["
+        for start in range(0, len(records), chunk_size):
+            chunk = b",".join(records[start : start + chunk_size])
+            yield chunk if start == 0 else b"," + chunk
+        yield b"]"
 
 
 # ============================================================================
@@ -414,29 +655,33 @@ class BackgroundTaskManager:
 
     async def data_update_loop(self):
         """
-        Loop infinito que atualiza dados a cada 2 segundos
+        Loop infinito que atualiza dados quando solicitado via
+        DataManager.wakeup() ou, no máximo, a cada update_interval (2 segundos)
         Simula coleta em tempo real do hardware
         """
-        print("[INFO] Iniciando loop de atualização de dados (intervalo: 2s)")
+        interval = self.data_manager.update_interval
+        print(
+            f"[INFO] Iniciando loop de atualização de dados (intervalo máximo: {interval:g}s)"
+        )
 
         while True:
             try:
                 # Atualiza dados
-                self.data_manager.update_data()
+                await self.data_manager.update_data()
 
-                # Aguarda 2 segundos
-                await asyncio.sleep(2)
+                # Aguarda um evento de atualização ou o intervalo máximo
+                await self.data_manager.wait_for_wakeup(timeout=interval)
 
             except Exception as e:
                 print(f"[ERRO] Erro no loop de atualização: {e}")
-                await asyncio.sleep(2)  # Continua executando mesmo com erro
+                await asyncio.sleep(interval)  # Continua executando mesmo com erro
 
     async def start(self):
         """Inicia a tarefa em background"""
         self.task = asyncio.create_task(self.data_update_loop())
 
     async def stop(self):
-        """Para a tarefa em background"""
+        """Para a tarefa em background e persiste os dados pendentes"""
         if self.task:
             self.task.cancel()
             try:
@@ -445,6 +690,8 @@ class BackgroundTaskManager:
                 pass
             print("[INFO] Loop de atualização encerrado")
 
+        await self.data_manager.flush()
+
 
 # ============================================================================
 # MÓDULO: API SERVER (FastAPI Application)
@@ -467,7 +714,7 @@ async def lifespan(app: FastAPI):
     print("=" * 60)
 
     # Primeira atualização de dados
-    data_manager.update_data()
+    await data_manager.update_data()
 
     # Inicia loop de atualização em background
     await background_manager.start()
@@ -480,6 +727,10 @@ async def lifespan(app: FastAPI):
     print("=" * 60)
     await background_manager.stop()
 
+    # Garante que nenhum dado pendente seja perdido
+    await data_manager.flush()
+    data_manager.close()
+
 
 # Cria aplicação FastAPI
 app = FastAPI(
@@ -490,34 +741,45 @@ app = FastAPI(
 )
 
 
-@app.get("/api/data", response_model=ProcessedRobotData)
+@app.get("/api/data", responses={200: {"model": ProcessedRobotData}})
 async def get_robot_data():
     """
     Endpoint para dados atuais: Retorna apenas a última coleta (substituição)
 
+    O JSON é serializado uma única vez a cada atualização e reutilizado
+    em todas as requisições, sem revalidação pelo FastAPI.
+
     Returns:
         ProcessedRobotData: Dados processados atuais dos motores, pallets e giroscópio
     """
-    current_data = data_manager.get_current_data()
+    current_json = await data_manager.get_current_json_bytes()
 
-    if current_data is None:
+    if current_json is None:
         # Caso não haja dados, faz uma atualização imediata
-        data_manager.update_data()
-        current_data = data_manager.get_current_data()
+        await data_manager.update_data()
+        current_json = await data_manager.get_current_json_bytes()
+    elif data_manager.is_stale():
+        # Dados mais antigos que o intervalo máximo: antecipa a próxima coleta
+        data_manager.wakeup()
 
-    return current_data
+    return Response(content=current_json, media_type="application/json")
 
 
-@app.get("/api/hist_data", response_model=List[HistoricalRecord])
+@app.get("/api/hist_data", responses={200: {"model": List[HistoricalRecord]}})
 async def get_historical_data():
     """
     Endpoint para histórico: Retorna todos os registros históricos
 
+    A resposta é transmitida em blocos a partir dos registros já
+    serializados, sem montar o JSON completo em memória nem revalidar
+    os registros pelo FastAPI.
+
     Returns:
         List[HistoricalRecord]: Lista completa do histórico com timestamps de coleta
     """
-    historical_data = data_manager.get_historical_data()
-    return historical_data
+    return StreamingResponse(
+        data_manager.iter_historical_json(), media_type="application/json"
+    )
 
 
 @app.get("/")
@@ -542,6 +804,14 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
+    # Usa o event loop do uvloop (nativo) quando disponível
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     print("\n" + "=" * 60)
     print("INICIANDO SERVIDOR FASTAPI")
     print("=" * 60)
@@ -549,6 +819,7 @@ if __name__ == "__main__":
     print("API de Dados Atuais: http://localhost:8000/api/data")
     print("API de Histórico: http://localhost:8000/api/hist_data")
     print("Documentação: http://localhost:8000/docs")
+    print(f"Event loop: {loop}")
     print("=" * 60 + "\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", loop=loop)